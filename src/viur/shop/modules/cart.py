@@ -99,7 +99,7 @@ class Cart(ShopModuleAbstract, Tree):
 
         if user := current.user.get():
             for wishlist in user["wishlist"]:
-                logger.debug(f"{wishlist = }")
+                logger.debug("wishlist = %r", wishlist)
                 root_nodes.append({
                     "key": wishlist["key"],
                     "name": wishlist["name"],
@@ -129,21 +129,24 @@ class Cart(ShopModuleAbstract, Tree):
 
     def is_valid_node(
         self,
-        node_key: db.Key,
+        node_key: db.Key | SkeletonInstance,
         root_node: bool = False,
     ) -> bool:
         """
         is this a valid node key for the user?
 
-        :param node_key: Key of node to check
+        :param node_key: Key of node to check, or the already loaded node skel
         :param root_node: Must this be a root node, or is any node okay?
         """
         # TODO: return (okay_status, reason, skel) tuple/Dataclass?
-        skel = self.viewSkel("node")
-        if not skel.fromDB(node_key):
-            logger.debug(f"fail reason: 404")
-            return False
-        logger.debug(f'{skel=}')
+        if isinstance(node_key, SkeletonInstance):
+            skel = node_key
+        else:
+            skel = self.viewSkel("node")
+            if not skel.fromDB(node_key):
+                logger.debug(f"fail reason: 404")
+                return False
+        logger.debug("skel=%r", skel)
         if root_node and not skel["is_root_node"]:
             # The node is not a root node, but a root nodes is expected
             logger.debug(f"fail reason: not a root node")
@@ -157,7 +160,8 @@ class Cart(ShopModuleAbstract, Tree):
         if not skel["is_root_node"] and skel["parentrepo"] not in available_root_nodes_keys:
             # The node is a node, but the root node is not from the user
             logger.debug(f"fail reason: not a child of valid root node")
-            logger.debug(f'{skel["parentrepo"]=} // {available_root_nodes_keys=}')
+            logger.debug('skel["parentrepo"]=%r // available_root_nodes_keys=%r',
+                         skel["parentrepo"], available_root_nodes_keys)
             return False
         return True
 
@@ -205,6 +209,15 @@ class Cart(ShopModuleAbstract, Tree):
             raise TypeError(f"parent_cart_key must be an instance of db.Key")
         if not self.is_valid_node(parent_cart_key):
             raise e.InvalidArgumentException("parent_cart_key", parent_cart_key)
+        return self._get_article(article_key, parent_cart_key, must_be_listed)
+
+    def _get_article(
+        self,
+        article_key: db.Key,
+        parent_cart_key: db.Key,
+        must_be_listed: bool = True,
+    ):
+        """Like get_article, but without validating the parent node"""
         skel = self.viewSkel("leaf")
         query: db.Query = skel.all()
         query.filter("parententry =", parent_cart_key)
@@ -227,16 +240,14 @@ class Cart(ShopModuleAbstract, Tree):
             raise TypeError(f"parent_cart_key must be an instance of db.Key")
         if not isinstance(quantity_mode, QuantityMode):
             raise TypeError(f"quantity_mode must be an instance of QuantityMode")
-        if not self.is_valid_node(parent_cart_key):
+        parent_skel = self.viewSkel("node")
+        if not parent_skel.fromDB(parent_cart_key) or not self.is_valid_node(parent_skel):
             raise e.InvalidArgumentException("parent_cart_key", parent_cart_key)
-        parent_skel = None
-        if not (skel := self.get_article(article_key, parent_cart_key, must_be_listed=False)):
+        if not (skel := self._get_article(article_key, parent_cart_key, must_be_listed=False)):
             logger.info("This is an add")
             skel = self.addSkel("leaf")
             res = skel.setBoneValue("article", article_key)
             skel["parententry"] = parent_cart_key
-            parent_skel = self.viewSkel("node")
-            assert parent_skel.fromDB(parent_cart_key)
             if parent_skel["is_root_node"]:
                 skel["parentrepo"] = parent_skel["key"]
             else:
@@ -257,8 +268,6 @@ class Cart(ShopModuleAbstract, Tree):
                 else:
                     raise NotImplementedError
                 skel[bone] = value
-        else:
-            parent_skel = skel.parent_skel
         if quantity == 0 and quantity_mode in (QuantityMode.INCREASE, QuantityMode.DECREASE):
             raise e.InvalidArgumentException(
                 "quantity",
@@ -285,7 +294,7 @@ class Cart(ShopModuleAbstract, Tree):
         except (TypeError, KeyError) as exc:
             logger.debug(exc, exc_info=True)
             discount_type = None
-        logger.debug(f"{discount_type=}")
+        logger.debug("discount_type=%r", discount_type)
         if discount_type == DiscountType.FREE_ARTICLE and skel["quantity"] > 1:
             raise e.InvalidArgumentException(
                 "quantity",
@@ -313,13 +322,13 @@ class Cart(ShopModuleAbstract, Tree):
                 descr_appendix=f"Article does not exist in cart node {parent_cart_key}."
             )
         parent_skel = self.viewSkel("node")
-        if not self.is_valid_node(new_parent_cart_key):
-            raise e.InvalidArgumentException("parent_cart_key", parent_cart_key)
         if not parent_skel.fromDB(new_parent_cart_key):
             raise e.InvalidArgumentException(
                 "new_parent_cart_key", new_parent_cart_key,
                 f"Target cart node does not exist"
             )
+        if not self.is_valid_node(parent_skel):
+            raise e.InvalidArgumentException("parent_cart_key", parent_cart_key)
         if parent_skel["parentrepo"] != skel["parentrepo"]:
             raise e.InvalidArgumentException(
                 "new_parent_cart_key", new_parent_cart_key,
@@ -384,7 +393,8 @@ class Cart(ShopModuleAbstract, Tree):
         # TODO: must be inside a own root node ...
         # if not self.canEdit(skel):
         #     raise errors.Forbidden
-        assert skel.fromDB(cart_key)
+        if not skel.fromDB(cart_key):
+            raise errors.NotFound(f"Cart with key {cart_key=} does not exist!")
         skel = self._cart_set_values(
             skel=skel,
             parent_cart_key=parent_cart_key,
@@ -416,10 +426,9 @@ class Cart(ShopModuleAbstract, Tree):
                 skel["is_root_node"] = True
             else:
                 skel["is_root_node"] = False
-                if not self.is_valid_node(parent_cart_key):
-                    raise e.InvalidArgumentException("parent_cart_key", parent_cart_key)
                 parent_skel = self.viewSkel("node")
-                assert parent_skel.fromDB(parent_cart_key)
+                if not parent_skel.fromDB(parent_cart_key) or not self.is_valid_node(parent_skel):
+                    raise e.InvalidArgumentException("parent_cart_key", parent_cart_key)
                 if parent_skel["is_root_node"]:
                     skel["parentrepo"] = parent_skel["key"]
                 else:
@@ -498,7 +507,7 @@ class Cart(ShopModuleAbstract, Tree):
                 raise InvalidStateError(f"{pk=} doesn't exist!")
             if discount := skel["discount"]:
                 discounts.append(discount["dest"])
-        logger.debug(f"{discounts = }")
+        logger.debug("discounts = %r", discounts)
         return discounts
 
     def add_new_parent(self, leaf_skel, **kwargs):
@@ -149,7 +149,8 @@ class Discount(ShopModuleAbstract, List):
                     for leaf_skel in leaf_skels:
                         # Assign discount on new parent node for the leaf where the article is
                         parent_skel = self.shop.cart.viewSkel("node")
-                        assert parent_skel.fromDB(leaf_skel["parententry"])
+                        if not parent_skel.fromDB(pk := leaf_skel["parententry"]):
+                            raise InvalidStateError(f"{pk=} doesn't exist!")
                         if parent_skel["discount"] and parent_skel["discount"]["dest"]["key"] == discount_skel["key"]:
                             logger.info("Parent has already this discount key")
                             continue
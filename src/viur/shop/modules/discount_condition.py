@@ -10,7 +10,7 @@ from viur.core.skeleton import SkeletonInstance
 from .abstract import ShopModuleAbstract
 from ..globals import SHOP_INSTANCE, SHOP_LOGGER
 from ..services import Event, on_event
-from ..types import CodeType
+from ..types import CodeType, InvalidStateError
 
 logger = SHOP_LOGGER.getChild(__name__)
 
@@ -149,7 +149,8 @@ class DiscountCondition(ShopModuleAbstract, List):
         for cond_skel in query.fetch(100):
             if cond_skel["is_subcode"]:
                 parent_cond_skel = self.viewSkel()
-                assert parent_cond_skel.fromDB(cond_skel["parent_code"]["dest"]["key"])
+                if not parent_cond_skel.fromDB(pk := cond_skel["parent_code"]["dest"]["key"]):
+                    raise InvalidStateError(f"{pk=} doesn't exist!")
                 yield parent_cond_skel
                 # yield cond_skel["parent_code"]["dest"]
             else:
@@ -9,7 +9,6 @@ from .abstract import ShopModuleAbstract
 from ..globals import SENTINEL, SHOP_LOGGER
 from ..payment_providers import PaymentProviderAbstract
 from ..services import EVENT_SERVICE, Event, HOOK_SERVICE, Hook
-from ..skeletons.order import get_payment_providers
 from ..types import exceptions as e
 
 if t.TYPE_CHECKING:
@@ -17,6 +16,9 @@ if t.TYPE_CHECKING:
 
 logger = SHOP_LOGGER.getChild(__name__)
 
+_ADDRESS_TYPE_BILLING: t.Final[AddressType] = AddressType.BILLING
+_KEY_OR_NONE: t.Final[tuple[type, ...]] = (db.Key, type(None))
+
 
 class Order(ShopModuleAbstract, List):
     kindName = "shop_order"
@@ -28,7 +30,7 @@ class Order(ShopModuleAbstract, List):
 
     @exposed
     def payment_providers_list(self):
-        return JsonResponse(get_payment_providers())
+        return JsonResponse(dict(self.shop.payment_provider_titles))
 
     def order_add(
         self,
@@ -43,15 +45,14 @@ class Order(ShopModuleAbstract, List):
     ):
         if not isinstance(cart_key, db.Key):
             raise TypeError(f"cart_key must be an instance of db.Key")
-        if billing_address_key is not SENTINEL and not isinstance(billing_address_key, (db.Key, type(None))):
+        if billing_address_key is not SENTINEL and not isinstance(billing_address_key, _KEY_OR_NONE):
             raise TypeError(f"billing_address_key must be an instance of db.Key")
-        if customer_key is not SENTINEL and not isinstance(customer_key, (db.Key, type(None))):
+        if customer_key is not SENTINEL and not isinstance(customer_key, _KEY_OR_NONE):
             raise TypeError(f"customer_key must be an instance of db.Key")
         skel = self.addSkel()
         cart_skel = self.shop.cart.viewSkel("node")
-        if not self.shop.cart.is_valid_node(cart_key, root_node=True):
+        if not cart_skel.fromDB(cart_key) or not self.shop.cart.is_valid_node(cart_skel, root_node=True):
             raise ValueError(f"Invalid {cart_key=}!")
-        assert cart_skel.fromDB(cart_key)
         skel.setBoneValue("cart", cart_key)
         skel["total"] = cart_skel["total"]
         if payment_provider is not SENTINEL:
@@ -61,7 +62,7 @@ class Order(ShopModuleAbstract, List):
                 skel["billing_address"] = None
             else:
                 skel.setBoneValue("billing_address", billing_address_key)
-                if skel["billing_address"]["dest"]["address_type"] != AddressType.BILLING:
+                if skel["billing_address"]["dest"]["address_type"] != _ADDRESS_TYPE_BILLING:
                     raise e.InvalidArgumentException(
                         "shipping_address",
                         descr_appendix="Address is not of type billing."
@@ -101,9 +102,9 @@ class Order(ShopModuleAbstract, List):
     ):
         if not isinstance(order_key, db.Key):
             raise TypeError(f"order_key must be an instance of db.Key")
-        if billing_address_key is not SENTINEL and not isinstance(billing_address_key, (db.Key, type(None))):
+        if billing_address_key is not SENTINEL and not isinstance(billing_address_key, _KEY_OR_NONE):
             raise TypeError(f"billing_address_key must be an instance of db.Key")
-        if customer_key is not SENTINEL and not isinstance(customer_key, (db.Key, type(None))):
+        if customer_key is not SENTINEL and not isinstance(customer_key, _KEY_OR_NONE):
             raise TypeError(f"customer_key must be an instance of db.Key")
         skel = self.editSkel()
         if not skel.fromDB(order_key):
@@ -116,7 +117,7 @@ class Order(ShopModuleAbstract, List):
                 skel["billing_address"] = None
             else:
                 skel.setBoneValue("billing_address", billing_address_key)
-                if skel["billing_address"]["dest"]["address_type"] != AddressType.BILLING:
+                if skel["billing_address"]["dest"]["address_type"] != _ADDRESS_TYPE_BILLING:
                     raise e.InvalidArgumentException(
                         "shipping_address",
                         descr_appendix="Address is not of type billing."
@@ -160,8 +161,8 @@ class Order(ShopModuleAbstract, List):
             }, status_code=400)
             raise e.InvalidStateError(", ".join(errors))
 
+        # freeze_order() already writes the order_skel
         order_skel = self.freeze_order(order_skel)
-        order_skel.toDB()
         EVENT_SERVICE.call(Event.ORDER_STARTED, order_skel=order_skel)
         return JsonResponse({
             "skel": order_skel,
@@ -172,18 +173,34 @@ class Order(ShopModuleAbstract, List):
     def can_checkout(
         self,
         order_skel: "SkeletonInstance",
+        *,
+        bail: bool = False,
     ) -> list[ClientError]:
+        """Collect the errors which prevent a checkout start
+
+        :param bail: Return on the first error, skipping the remaining
+            (and maybe expensive) checks of the payment provider.
+        """
         errors = []
         if not order_skel["cart"]:
             errors.append(ClientError("cart is missing"))
+            if bail:
+                return errors
         if not order_skel["payment_provider"]:
             errors.append(ClientError("missing payment_provider"))
+            return errors
         if pp_errors := self.get_payment_provider_by_name(order_skel["payment_provider"]).can_checkout(order_skel):
             errors.extend(pp_errors)
 
         # TODO: ...
         return errors
 
+    def is_checkoutable(
+        self,
+        order_skel: "SkeletonInstance",
+    ) -> bool:
+        return not self.can_checkout(order_skel, bail=True)
+
     def freeze_order(
         self,
         order_skel: "SkeletonInstance",
@@ -194,14 +211,16 @@ class Order(ShopModuleAbstract, List):
         self.shop.cart.freeze_cart(order_skel["cart"]["dest"]["key"])
 
         cart_skel = self.shop.cart.viewSkel("node")
-        assert cart_skel.fromDB(order_skel["cart"]["dest"]["key"])
+        if not cart_skel.fromDB(cart_key := order_skel["cart"]["dest"]["key"]):
+            raise e.InvalidStateError(f"{cart_key=} doesn't exist!")
         order_skel["total"] = cart_skel["total"]
 
         # Clone the address, so in case the user edits the address, existing orders wouldn't be affected by this
         # TODO: Can we do this copy-on-write instead; clone if an address is edited and replace on used order skels?
         ba_skel = self.shop.address.editSkel()
         ba_key = order_skel["billing_address"]["dest"]["key"]
-        assert ba_skel.fromDB(ba_key)
+        if not ba_skel.fromDB(ba_key):
+            raise e.InvalidStateError(f"{ba_key=} doesn't exist!")
         # Remove the key to clone it #  TODO: why does this not work?
         # ba_skel.dbEntity.key = None
         # ba_skel.accessedValues.pop("key", None)
@@ -228,10 +247,8 @@ class Order(ShopModuleAbstract, List):
         self,
         order_skel: "SkeletonInstance",
     ) -> "SkeletonInstance":
-        order_skel["order_uid"] = "".join(
-            f"-{c}" if i % 4 == 0 else c
-            for i, c in enumerate(str(time.time()).replace(".", ""))
-        ).strip("-")
+        uid = str(time.time()).replace(".", "")
+        order_skel["order_uid"] = "-".join(uid[i:i + 4] for i in range(0, len(uid), 4))
         # TODO: customize by hook, claim in transaction, ...
         return order_skel
 
@@ -272,24 +289,50 @@ class Order(ShopModuleAbstract, List):
     def can_order(
         self,
         order_skel: "SkeletonInstance",
+        *,
+        bail: bool = False,
     ) -> list[ClientError]:
+        """Collect the errors which prevent ordering
+
+        :param bail: Return on the first error, skipping the remaining
+            (and maybe expensive) checks of the payment provider.
+        """
         errors = []
         if order_skel["is_ordered"]:
             errors.append(ClientError("already is_ordered"))
+            if bail:
+                return errors
         if not order_skel["cart"]:
             errors.append(ClientError("cart is missing"))
+            if bail:
+                return errors
         if not order_skel["cart"] or not order_skel["cart"]["dest"]["shipping_address"]:
             errors.append(ClientError("cart.shipping_address is missing"))
+            if bail:
+                return errors
         if not order_skel["payment_provider"]:
             errors.append(ClientError("missing payment_provider"))
+            if bail:
+                return errors
         if not order_skel["billing_address"]:
             errors.append(ClientError("billing_address is missing"))
-        if pp_errors := self.get_payment_provider_by_name(order_skel["payment_provider"]).can_order(order_skel):
+            if bail:
+                return errors
+        if (
+            order_skel["payment_provider"]
+            and (pp_errors := self.get_payment_provider_by_name(order_skel["payment_provider"]).can_order(order_skel))
+        ):
             errors.extend(pp_errors)
 
         # TODO: ...
         return errors
 
+    def is_orderable(
+        self,
+        order_skel: "SkeletonInstance",
+    ) -> bool:
+        return not self.can_order(order_skel, bail=True)
+
     def set_ordered(self, order_skel: "SkeletonInstance", payment: t.Any) -> "SkeletonInstance":
         order_skel["is_ordered"] = True  # TODO: transaction
         order_skel.toDB()
@@ -307,7 +350,7 @@ class Order(ShopModuleAbstract, List):
         self,
         payment_provider_name: str,
     ) -> PaymentProviderAbstract:
-        for pp in self.shop.payment_providers:
-            if payment_provider_name == pp.name:
-                return pp
-        raise LookupError(f"Unknown payment provider {payment_provider_name}")
+        try:
+            return self.shop.payment_providers_by_name[payment_provider_name]
+        except KeyError:
+            raise LookupError(f"Unknown payment provider {payment_provider_name}")
@@ -3,7 +3,7 @@ import typing as t
 
 from viur.shop.data.translations import TRANSLATIONS
 
-from viur.core import conf
+from viur.core import conf, translate
 from viur.core.bones import RelationalBone
 from viur.core.decorators import exposed
 from viur.core.module import Module
@@ -48,6 +48,12 @@ class Shop(InstancedModule, Module):
         self.name: str = name
         self.article_skel: t.Type[Skeleton] = article_skel
         self.payment_providers: list[PaymentProviderAbstract] = payment_providers
+        self.payment_providers_by_name: dict[str, PaymentProviderAbstract] = {
+            pp.name: pp for pp in payment_providers
+        }
+        self.payment_provider_titles: dict[str, str | translate] = {
+            pp.name: pp.title for pp in payment_providers
+        }
         self.suppliers: list[Supplier] = suppliers
         self.admin_info_module_group: str | None = admin_info_module_group
         self.additional_settings: dict[str, t.Any] = dict(kwargs)
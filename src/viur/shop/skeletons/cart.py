@@ -241,7 +241,8 @@ class CartItemSkel(TreeSkel):  # STATE: Complete (as in model)
         # TODO: Cache this property
         # logger.debug(f'Reading article_skel_full {self.article_skel["key"]=}')
         skel = SHOP_INSTANCE.get().article_skel()
-        assert skel.fromDB(self.article_skel["key"])
+        if not skel.fromDB(key := self.article_skel["key"]):
+            raise InvalidStateError(f"{key=} doesn't exist!")
         return skel
 
     @property
@@ -249,7 +250,8 @@ class CartItemSkel(TreeSkel):  # STATE: Complete (as in model)
         if not (pk := self["parententry"]):
             return None
         skel = SHOP_INSTANCE.get().cart.viewSkel("node")
-        assert skel.fromDB(pk)
+        if not skel.fromDB(pk):
+            raise InvalidStateError(f"{pk=} doesn't exist!")
         return skel
 
     @property
@@ -10,10 +10,7 @@ logger = SHOP_LOGGER.getChild(__name__)
 
 
 def get_payment_providers() -> dict[str, str | translate]:
-    return {
-        pp.name: pp.title
-        for pp in SHOP_INSTANCE.get().payment_providers
-    }
+    return dict(SHOP_INSTANCE.get().payment_provider_titles)
 
 
 class OrderSkel(Skeleton):  # STATE: Complete (as in model)
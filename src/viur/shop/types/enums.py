@@ -6,7 +6,7 @@ import enum
 import typing as t
 
 
-class ArticleAvailability(enum.Enum):
+class ArticleAvailability(str, enum.Enum):
     IN_STOCK = "instock"
     OUT_OF_STOCK = "outofstock"
     LIMITED = "limited"
@@ -14,7 +14,7 @@ class ArticleAvailability(enum.Enum):
     PREORDER = "preorder"
 
 
-class CartType(enum.Enum):
+class CartType(str, enum.Enum):
     WISHLIST = "wishlist"
     BASKET = "basket"
 